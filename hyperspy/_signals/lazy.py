@@ -18,6 +18,8 @@
 
 import logging
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from itertools import product
 
@@ -60,6 +62,25 @@
     _logger.info("Dask widgets not loaded (dask >=2021.11.1 is required)")
 
 
+_prefetch_executor = None
+
+
+def _get_prefetch_executor():
+    """Return the thread pool used to load chunks of lazy signals in the
+    background."""
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="hyperspy-chunk-prefetch"
+        )
+    return _prefetch_executor
+
+
+def _get_chunk_key(chunk_slice):
+    # slices are not hashable before python 3.12
+    return tuple((s.start, s.stop) for s in chunk_slice)
+
+
 def _get():
     try:
         get = dask.threaded.get
@@ -125,8 +146,15 @@ def __init__(self, *args, **kwargs):
         # _cache_dask_chunk has the NumPy array itself, while
         # _cache_dask_chunk_slice has the navigation dimension chunk which
         # the NumPy array originates from.
+        # The last used chunks are also kept in the _cache_dask_chunks LRU
+        # cache, within the preferences.General.lazy_chunk_cache_size memory
+        # budget, and the adjacent chunks are loaded in the background in
+        # _cache_dask_chunks_prefetch.
         self._cache_dask_chunk = None
         self._cache_dask_chunk_slice = None
+        self._cache_dask_chunks = OrderedDict()
+        self._cache_dask_chunks_prefetch = {}
+        self._cache_dask_navigation_indices = None
         if self._clear_cache_dask_data not in self.events.data_changed.connected:
             self.events.data_changed.connect(self._clear_cache_dask_data)
 
@@ -308,6 +336,11 @@ def close_file(self):
     def _clear_cache_dask_data(self, obj=None):
         self._cache_dask_chunk = None
         self._cache_dask_chunk_slice = None
+        for future in getattr(self, "_cache_dask_chunks_prefetch", {}).values():
+            future.cancel()
+        self._cache_dask_chunks = OrderedDict()
+        self._cache_dask_chunks_prefetch = {}
+        self._cache_dask_navigation_indices = None
 
     def _get_dask_chunks(self, axis=None, dtype=None):
         """Returns dask chunks.
@@ -524,17 +557,22 @@ def _get_cache_dask_chunk(self, indices):
         position with the same chunk will be much faster, reducing amount of
         data which needs be read from the disk.
 
-        If a navigation index (via the indices parameter) in a different chunk
-        is asked for, the currently cached chunk is discarded, and the new
-        chunk is loaded into memory.
+        The last used chunks are kept in a least recently used cache, whose
+        maximum size is set by ``preferences.General.lazy_chunk_cache_size``,
+        so that moving back and forth across chunk boundaries doesn't read
+        the same chunks again. In addition, if
+        ``preferences.General.lazy_chunk_prefetch`` is enabled, the chunks
+        adjacent to the current chunk in the direction of travel are loaded
+        in a background thread.
 
         This only works for functions using self.__call__, for example
         plot and fitting functions. This will not work with the region of
         interest functionality.
 
-        The cached chunk is stored in the attribute s._cache_dask_chunk,
+        The current chunk is stored in the attribute s._cache_dask_chunk,
         and the slice needed to extract this chunk is in
-        s._cache_dask_chunk_slice. To these, use s._clear_cache_dask_data()
+        s._cache_dask_chunk_slice. To clear the cache, use
+        s._clear_cache_dask_data()
 
         Parameters
         ----------
@@ -553,7 +591,7 @@ def _get_cache_dask_chunk(self, indices):
         >>> value = s._get_cache_dask_chunk((3, 6, 2))
         >>> cached_chunk = s._cache_dask_chunk # Cached array
         >>> cached_chunk_slice = s._cache_dask_chunk_slice # Slice of chunk
-        >>> s._clear_cache_dask_data() # Clearing both of these
+        >>> s._clear_cache_dask_data() # Clearing the cache
 
         """
 
@@ -566,9 +604,9 @@ def _get_cache_dask_chunk(self, indices):
             chunk_slice != self._cache_dask_chunk_slice
             or self._cache_dask_chunk is None
         ):
-            with dummy_context_manager():
-                self._cache_dask_chunk = self.data.__getitem__(chunk_slice).compute()
+            self._cache_dask_chunk = self._get_dask_chunk(chunk_slice)
             self._cache_dask_chunk_slice = chunk_slice
+        self._prefetch_dask_chunks(navigation_indices, chunk_slice, chunks)
 
         indices = list(indices)
         for i, temp_slice in enumerate(chunk_slice):
@@ -577,6 +615,99 @@ def _get_cache_dask_chunk(self, indices):
         value = self._cache_dask_chunk[indices]
         return value
 
+    def _get_dask_chunk(self, chunk_slice):
+        """Return a navigation chunk, from the LRU cache when available,
+        otherwise from the prefetched chunks or by computing it."""
+        self._collect_prefetched_dask_chunks()
+        key = _get_chunk_key(chunk_slice)
+        if key in self._cache_dask_chunks:
+            self._cache_dask_chunks.move_to_end(key)
+            return self._cache_dask_chunks[key]
+        future = self._cache_dask_chunks_prefetch.pop(key, None)
+        chunk = None
+        if future is not None and not future.cancelled():
+            try:
+                chunk = future.result()
+            except Exception as error:  # pragma: no cover
+                _logger.debug(f"Prefetching chunk {chunk_slice} failed: {error}")
+        if chunk is None:
+            with dummy_context_manager():
+                chunk = self.data.__getitem__(chunk_slice).compute()
+        self._add_dask_chunk_to_cache(key, chunk)
+        return chunk
+
+    def _collect_prefetched_dask_chunks(self):
+        """Move the chunks which have been loaded in the background to the
+        LRU cache, so that they count in its memory budget."""
+        for key, future in list(self._cache_dask_chunks_prefetch.items()):
+            if future.done():
+                del self._cache_dask_chunks_prefetch[key]
+                if not future.cancelled() and future.exception() is None:
+                    self._add_dask_chunk_to_cache(key, future.result())
+
+    def _add_dask_chunk_to_cache(self, key, chunk):
+        cache_size = preferences.General.lazy_chunk_cache_size * 2**20
+        self._cache_dask_chunks[key] = chunk
+        self._cache_dask_chunks.move_to_end(key)
+        nbytes = sum(c.nbytes for c in self._cache_dask_chunks.values())
+        # the most recently used chunk is always kept
+        while nbytes > cache_size and len(self._cache_dask_chunks) > 1:
+            _, removed = self._cache_dask_chunks.popitem(last=False)
+            nbytes -= removed.nbytes
+
+    def _prefetch_dask_chunks(self, navigation_indices, chunk_slice, chunks):
+        """Load in the background the chunks adjacent to the current chunk
+        in the direction of travel."""
+        previous_indices = self._cache_dask_navigation_indices
+        self._cache_dask_navigation_indices = navigation_indices
+        if (
+            not preferences.General.lazy_chunk_prefetch
+            or previous_indices is None
+            or len(previous_indices) != len(navigation_indices)
+        ):
+            return
+        # Only integer indices can be used to define a direction
+        if not all(
+            isinstance(i, (int, np.integer))
+            for i in tuple(navigation_indices) + tuple(previous_indices)
+        ):
+            return
+        chunk_nbytes = self._cache_dask_chunk.nbytes
+        cache_size = preferences.General.lazy_chunk_cache_size * 2**20
+        shape = self.data.shape
+        for axis, (index, previous_index) in enumerate(
+            zip(navigation_indices, previous_indices)
+        ):
+            direction = np.sign(index - previous_index)
+            if direction > 0:
+                neighbour_index = chunk_slice[axis].stop
+            elif direction < 0:
+                neighbour_index = chunk_slice[axis].start - 1
+            else:
+                continue
+            if not 0 <= neighbour_index < shape[axis]:
+                continue
+            neighbour_indices = list(navigation_indices)
+            neighbour_indices[axis] = neighbour_index
+            neighbour_slice = _get_navigation_dimension_chunk_slice(
+                neighbour_indices, chunks
+            )
+            key = _get_chunk_key(neighbour_slice)
+            if (
+                key in self._cache_dask_chunks
+                or key in self._cache_dask_chunks_prefetch
+                # the neighbour needs to fit in the cache with the current chunk
+                or 2 * chunk_nbytes > cache_size
+            ):
+                continue
+            try:
+                self._cache_dask_chunks_prefetch[key] = _get_prefetch_executor().submit(
+                    self.data.__getitem__(neighbour_slice).compute
+                )
+            except RuntimeError as error:  # pragma: no cover
+                # e.g. threads are not available in this environment
+                _logger.debug(f"Chunk prefetching is not available: {error}")
+
     def rebin(
         self,
         new_shape=None,
@@ -262,3 +262,24 @@ def wrap2(*args2, **kwargs2):
             return wrap2
 
         return wrap1
+
+
+def batched(func):
+    """Mark a function as operating on a batch of signals.
+
+    When used with :meth:`~hyperspy.api.signals.BaseSignal.map`, a decorated
+    function is called once per chunk with the navigation dimensions
+    flattened into a leading batch axis, instead of once per navigation
+    pixel. It must return an array whose first axis is the batch axis.
+
+    Examples
+    --------
+    >>> from hyperspy.decorators import batched
+    >>> @batched
+    ... def normalise(spectra):
+    ...     return spectra / spectra.sum(axis=-1, keepdims=True)
+    >>> s = hs.signals.Signal1D(np.random.random((10, 10, 100)))
+    >>> s.map(normalise)
+    """
+    func._hyperspy_batched = True
+    return func
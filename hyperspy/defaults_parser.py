@@ -93,6 +93,21 @@ class GeneralConfig(t.HasTraits):
 
     nb_progressbar = t.CBool(True, desc="Attempt to use ipywidgets progressbar")
 
+    lazy_chunk_cache_size = t.CFloat(
+        512.0,
+        label="Lazy chunk cache size (MB)",
+        desc="Maximum memory used to keep the chunks of lazy signals in memory "
+        "when navigating (e.g. plotting) or fitting them",
+    )
+
+    lazy_chunk_prefetch = t.CBool(
+        True,
+        label="Prefetch lazy chunks",
+        desc="If enabled, when navigating lazy signals, the chunks adjacent "
+        "to the current position in the direction of travel are loaded "
+        "in the background",
+    )
+
     def _logger_on_changed(self, old, new):
         if new is True:
             turn_logging_on()
@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+from contextlib import contextmanager
+
 import dask.array as da
 import numpy as np
 
@@ -237,3 +239,57 @@ def _calculate_covariance(
     k = coefficients.shape[-1]  # the number of components
     covariance = (1 / (n - k)) * (residual * inv_fit_dot.T).T
     return covariance
+
+
+def _get_parameter_map_values(parameter, block=()):
+    """
+    Return the values of the parameter map for a block of the navigation
+    space, taking into account the twin (and twin function) of the parameter.
+    """
+    if parameter.twin is None:
+        return parameter.map["values"][block]
+    values = _get_parameter_map_values(parameter.twin, block)
+    if parameter._twin_function:
+        values = parameter._twin_function(values)
+    return values
+
+
+def _is_parameter_map_set(parameter):
+    """
+    Return True if the parameter map is set at all navigation positions,
+    following twins to the parameter that defines the values.
+    """
+    while parameter.twin is not None:
+        parameter = parameter.twin
+    return bool(np.all(parameter.map["is_set"]))
+
+
+@contextmanager
+def _parameter_maps_block(components, block):
+    """
+    Temporarily replace the parameter maps of the components by a block of
+    the navigation space, e.g. to evaluate ``function_nd`` chunk by chunk.
+    Twinned parameters are given the values defined by their twin.
+
+    Parameters
+    ----------
+    components : list of :class:`~hyperspy.component.Component`
+    block : tuple of slice
+        The block of the navigation space, in array order.
+    """
+    parameters = [p for component in components for p in component.parameters]
+    maps = [parameter.map for parameter in parameters]
+    # all blocks need to be computed before replacing any map, since twins
+    # may refer to the parameters of other components
+    blocks = []
+    for parameter in parameters:
+        map_block = parameter.map[block].copy()
+        map_block["values"] = _get_parameter_map_values(parameter, block)
+        blocks.append(map_block)
+    try:
+        for parameter, map_block in zip(parameters, blocks):
+            parameter.map = map_block
+        yield
+    finally:
+        for parameter, map_ in zip(parameters, maps):
+            parameter.map = map_
@@ -23,6 +23,7 @@
 import logging
 import types
 import unicodedata
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping
 from contextlib import contextmanager
 from io import StringIO
@@ -1317,6 +1318,7 @@ def process_function_blockwise(
     output_signal_size=None,
     output_dtype=None,
     arg_keys=None,
+    vectorized=False,
     **kwargs,
 ):
     """
@@ -1342,6 +1344,10 @@ def process_function_blockwise(
     arg_keys : tuple
         The list of keys for the passed arguments (args).  Together this makes
         a set of key:value pairs to be passed to the function.
+    vectorized : bool
+        If True, the function is called once for the whole chunk with the
+        navigation axes flattened into a leading batch axis, instead of once
+        per navigation pixel.
     **kwargs : dict
         Any additional key value pairs to be used by the function
         (Note that these are the constants that are applied.)
@@ -1351,6 +1357,27 @@ def process_function_blockwise(
     dtype = output_dtype
     chunk_nav_shape = tuple([data.shape[i] for i in sorted(nav_indexes)])
     output_shape = chunk_nav_shape + tuple(output_signal_size)
+    if vectorized:
+        nav_dim = len(chunk_nav_shape)
+        batch_size = int(np.prod(chunk_nav_shape))
+        iter_dict = {}
+        for key, a in zip(arg_keys, args):
+            arg_i = a.reshape((batch_size,) + a.shape[nav_dim:])
+            # Same as the per-pixel squeeze, but keeping the batch axis
+            arg_i = arg_i.squeeze(
+                axis=tuple(i for i in range(1, arg_i.ndim) if arg_i.shape[i] == 1)
+            )
+            iter_dict[key] = arg_i
+        batch = data.reshape((batch_size,) + data.shape[nav_dim:])
+        output_array = np.asarray(
+            function(batch, **iter_dict, **kwargs), dtype=dtype, like=data
+        ).reshape(output_shape)
+        if not (chunk_nav_shape == output_array.shape):
+            try:
+                output_array = output_array.squeeze(-1)
+            except ValueError:
+                pass
+        return output_array
     # Pre-allocating the output array
     output_array = np.empty(output_shape, dtype=dtype, like=data)
     if len(args) == 0:
@@ -1378,6 +1405,231 @@ def process_function_blockwise(
     return output_array
 
 
+def _attach_shared_array(descriptor):
+    """Attach to a shared memory block and return it with a numpy view.
+
+    Parameters
+    ----------
+    descriptor : tuple
+        The ``(name, shape, dtype)`` descriptor of the shared array.
+    """
+    from multiprocessing import shared_memory
+
+    name, shape, dtype = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _create_shared_array(shape, dtype, data=None):
+    """Create a shared memory block holding an array of the given shape and
+    dtype, optionally initialised with ``data``.
+
+    Returns
+    -------
+    shm : multiprocessing.shared_memory.SharedMemory
+    array : numpy.ndarray
+        A view of the shared memory block.
+    descriptor : tuple
+        The ``(name, shape, dtype)`` descriptor used by the workers to attach
+        to the block.
+    """
+    from multiprocessing import shared_memory
+
+    dtype = np.dtype(dtype)
+    nbytes = max(int(np.prod(shape, dtype=int)) * dtype.itemsize, 1)
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    if data is not None:
+        array[...] = data
+    return shm, array, (shm.name, shape, dtype.str)
+
+
+def _process_block_shared_memory(
+    start,
+    stop,
+    data_descriptor,
+    args_descriptors,
+    output_descriptor,
+    pickled_function,
+    vectorized,
+):
+    """Process the navigation pixels ``start:stop`` of the shared data and
+    write the results into the shared output array. Used as the worker of
+    :func:`process_function_shared_memory`.
+    """
+    import cloudpickle
+
+    function, arg_keys, output_signal_size, output_dtype, kwargs = cloudpickle.loads(
+        pickled_function
+    )
+    shms = []
+    try:
+        shm, data = _attach_shared_array(data_descriptor)
+        shms.append(shm)
+        args = ()
+        for descriptor in args_descriptors:
+            shm, arg = _attach_shared_array(descriptor)
+            shms.append(shm)
+            args += (arg[start:stop],)
+        shm, output = _attach_shared_array(output_descriptor)
+        shms.append(shm)
+        result = process_function_blockwise(
+            data[start:stop],
+            *args,
+            function=function,
+            nav_indexes=(0,),
+            output_signal_size=output_signal_size,
+            output_dtype=output_dtype,
+            arg_keys=arg_keys,
+            vectorized=vectorized,
+            **kwargs,
+        )
+        output[start:stop] = result.reshape(output[start:stop].shape)
+        # release the views before closing the shared memory
+        del data, args, output, result
+    finally:
+        for shm in shms:
+            shm.close()
+    return stop - start
+
+
+def process_function_shared_memory(
+    data,
+    *args,
+    function,
+    output_signal_size,
+    output_dtype,
+    nav_dim,
+    arg_keys=None,
+    num_workers=None,
+    vectorized=False,
+    show_progressbar=None,
+    **kwargs,
+):
+    """Apply a function to all navigation pixels of a numpy array using a pool
+    of processes.
+
+    The input data and iterating arguments are placed in shared memory and
+    the workers only receive the range of navigation pixels to process.
+    The results are written into a preallocated shared output array, so that
+    the data is never pickled to the workers. This is useful for functions
+    which hold the GIL.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        The data with the navigation axes first.
+    *args : numpy.ndarray
+        The arguments iterated alongside the data, with the same navigation
+        shape.
+    function : function
+        The function to apply to the signal axes. It is serialised with
+        ``cloudpickle`` and must therefore be picklable by it.
+    output_signal_size : tuple
+        The shape of the output signal.
+    output_dtype : numpy.dtype
+        The data type for the output. Object dtype (ragged) is not supported.
+    nav_dim : int
+        The number of navigation dimensions.
+    arg_keys : tuple
+        The keys for the passed arguments (args).
+    num_workers : None or int
+        The number of processes. If None, the number of CPUs is used.
+    vectorized : bool
+        See :func:`process_function_blockwise`.
+    %s
+    **kwargs : dict
+        Any additional key value pairs to be used by the function.
+
+    Returns
+    -------
+    numpy.ndarray
+        The result with shape ``navigation_shape + output_signal_size``.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    import cloudpickle
+
+    from hyperspy.external.progressbar import progressbar
+
+    if np.dtype(output_dtype).hasobject:
+        raise ValueError(
+            "Object (ragged) output is not supported with the process scheduler."
+        )
+    if arg_keys is None:
+        arg_keys = ()
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    nav_shape = data.shape[:nav_dim]
+    nav_size = int(np.prod(nav_shape, dtype=int))
+    output_shape = nav_shape + tuple(output_signal_size)
+    # several blocks per worker for load balancing
+    n_blocks = max(min(nav_size, 4 * num_workers), 1)
+    bounds = np.linspace(0, nav_size, n_blocks + 1).astype(int)
+    pickled_function = cloudpickle.dumps(
+        (function, arg_keys, tuple(output_signal_size), output_dtype, kwargs)
+    )
+
+    shms = []
+    try:
+        shm, _, data_descriptor = _create_shared_array(
+            (nav_size,) + data.shape[nav_dim:],
+            data.dtype,
+            data.reshape((nav_size,) + data.shape[nav_dim:]),
+        )
+        shms.append(shm)
+        args_descriptors = []
+        for arg in args:
+            arg = np.asarray(arg)
+            shm, _, descriptor = _create_shared_array(
+                (nav_size,) + arg.shape[nav_dim:],
+                arg.dtype,
+                arg.reshape((nav_size,) + arg.shape[nav_dim:]),
+            )
+            shms.append(shm)
+            args_descriptors.append(descriptor)
+        shm, output, output_descriptor = _create_shared_array(
+            (nav_size,) + tuple(output_signal_size), output_dtype
+        )
+        shms.append(shm)
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(
+                    _process_block_shared_memory,
+                    start,
+                    stop,
+                    data_descriptor,
+                    args_descriptors,
+                    output_descriptor,
+                    pickled_function,
+                    vectorized,
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+                if stop > start
+            ]
+            with progressbar(
+                total=nav_size, disable=not show_progressbar, leave=True
+            ) as pbar:
+                for future in as_completed(futures):
+                    pbar.update(future.result())
+        result = output.reshape(output_shape).copy()
+        del output
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+    if not (nav_shape == result.shape):
+        try:
+            result = result.squeeze(-1)
+        except ValueError:
+            pass
+    return result
+
+
+process_function_shared_memory.__doc__ %= SHOW_PROGRESSBAR_ARG
+
+
 def _get_block_pattern(args, output_shape):
     """Returns the block pattern used by the `blockwise` function for a
     set of arguments give a resulting output_shape
@@ -1412,7 +1664,7 @@ def _get_block_pattern(args, output_shape):
     return arg_pairs, adjust_chunks, new_axis, output_pattern
 
 
-def guess_output_signal_size(test_data, function, ragged, **kwargs):
+def guess_output_signal_size(test_data, function, ragged, vectorized=False, **kwargs):
     """This function is for guessing the output signal shape and size.
     It will attempt to apply the function to some test data and then output
     the resulting signal shape and datatype.
@@ -1427,12 +1679,21 @@ def guess_output_signal_size(test_data, function, ragged, **kwargs):
     ragged : bool
         If the data is ragged then the output signal size is () and the
         data type is 'object'
+    vectorized : bool
+        If True, the function operates on a batch of signals. The test data
+        is given a leading batch axis of length 1, which is removed from the
+        output signal size. Iterating keyword arguments must already have
+        this batch axis.
     **kwargs : dict
         Any other keyword arguments passed to the function.
     """
     if ragged:
         output_dtype = object
         output_signal_size = ()
+    elif vectorized:
+        output = np.asarray(function(np.asarray(test_data)[np.newaxis], **kwargs))
+        output_dtype = output.dtype
+        output_signal_size = output.shape[1:]
     else:
         output = function(test_data, **kwargs)
         try:
@@ -1445,6 +1706,114 @@ def guess_output_signal_size(test_data, function, ragged, **kwargs):
     return output_signal_size, output_dtype
 
 
+# Cache of the output signal size and dtype of the functions applied with
+# ``BaseSignal.map``, to avoid running a dry run at each call
+_MAP_PROBE_CACHE = OrderedDict()
+_MAP_PROBE_CACHE_MAXSIZE = 128
+# Largest array (in bytes) that can be used as a key of the probe cache
+_MAP_PROBE_CACHE_MAX_ARRAY_NBYTES = 1024
+
+
+def _get_kwarg_signature(value):
+    """Return a hashable signature of a non-iterating keyword argument of
+    ``BaseSignal.map`` or None if the value can't be safely summarised.
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return (type(value), value)
+    elif isinstance(value, np.generic):
+        return (value.dtype.str, value.item())
+    elif isinstance(value, np.ndarray):
+        if value.nbytes > _MAP_PROBE_CACHE_MAX_ARRAY_NBYTES or value.dtype.hasobject:
+            return None
+        return (value.dtype.str, value.shape, value.tobytes())
+    elif isinstance(value, (tuple, list)):
+        signature = tuple(_get_kwarg_signature(v) for v in value)
+        if any(v is None for v in signature):
+            return None
+        return (type(value), signature)
+    return None
+
+
+def _get_map_probe_cache_key(
+    function, data, args, arg_keys, nav_dim, ragged, vectorized, **kwargs
+):
+    """Return the key of the map probe cache or None if the output signal
+    size and dtype of this call can't be cached.
+
+    The key is made of the function, the signal shape and dtype of the data
+    and of the iterating arguments and a signature of the other keyword
+    arguments. It is computed from the array metadata only, without reading
+    any data.
+    """
+    try:
+        hash(function)
+    except TypeError:
+        return None
+    kwargs_signature = []
+    for key in sorted(kwargs):
+        signature = _get_kwarg_signature(kwargs[key])
+        if signature is None:
+            return None
+        kwargs_signature.append((key, signature))
+    args_signature = tuple(
+        (key, tuple(a.shape[nav_dim:]), a.dtype.str) for key, a in zip(arg_keys, args)
+    )
+    return (
+        function,
+        tuple(data.shape[nav_dim:]),
+        data.dtype.str,
+        args_signature,
+        tuple(kwargs_signature),
+        bool(ragged),
+        bool(vectorized),
+    )
+
+
+def _get_map_probe_cache(key):
+    if key is None or key not in _MAP_PROBE_CACHE:
+        return None
+    _MAP_PROBE_CACHE.move_to_end(key)
+    return _MAP_PROBE_CACHE[key]
+
+
+def _set_map_probe_cache(key, value):
+    if key is None:
+        return
+    _MAP_PROBE_CACHE[key] = value
+    _MAP_PROBE_CACHE.move_to_end(key)
+    while len(_MAP_PROBE_CACHE) > _MAP_PROBE_CACHE_MAXSIZE:
+        _MAP_PROBE_CACHE.popitem(last=False)
+
+
+def _compute_first_block(array):
+    """Compute the first block of a dask array and return it together
+    with an equivalent dask array in which this block is not computed again.
+
+    Parameters
+    ----------
+    array : dask.array.Array
+
+    Returns
+    -------
+    block : numpy.ndarray
+        The computed first block of ``array``.
+    array : dask.array.Array
+        A dask array equal to the input array, whose first block is the
+        computed block instead of the task that reads it.
+    """
+    from dask.base import tokenize
+    from dask.highlevelgraph import HighLevelGraph
+
+    first_index = (0,) * array.ndim
+    block = array.blocks[first_index].compute()
+    name = "reuse-first-block-" + tokenize(array)
+    # alias every block of the input array except the first one
+    dsk = {(name,) + index: (array.name,) + index for index in np.ndindex(array.numblocks)}
+    dsk[(name,) + first_index] = block
+    graph = HighLevelGraph.from_collections(name, dsk, dependencies=[array])
+    return block, da.Array(graph, name, chunks=array.chunks, meta=array._meta)
+
+
 def multiply(iterable):
     """Return product of sequence of numbers.
 
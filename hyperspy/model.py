@@ -619,6 +619,13 @@ def as_signal(
         :class:`~hyperspy.api.signals.BaseSignal`
             The model as a signal.
 
+        Notes
+        -----
+        When all the components support ``function_nd`` and the parameter
+        maps are set at all navigation positions, the model is evaluated for
+        the whole navigation space (by blocks, to limit memory usage) instead
+        of pixel by pixel, which is much faster.
+
         Examples
         --------
         >>> s = hs.signals.Signal1D(np.random.random((10,100)))
@@ -654,9 +661,17 @@ def as_signal(
             channel_switches_backup = copy.copy(self._channel_switches)
             self._channel_switches[:] = True
 
-        self._as_signal_iter(
-            component_list=component_list, show_progressbar=show_progressbar, data=data
-        )
+        components_nd = self._get_components_nd(component_list)
+        if components_nd is not None:
+            self._as_signal_nd(
+                data, components_nd=components_nd, show_progressbar=show_progressbar
+            )
+        else:
+            self._as_signal_iter(
+                component_list=component_list,
+                show_progressbar=show_progressbar,
+                data=data,
+            )
 
         if not out_of_range_to_nan:
             # Restore the _channel_switches, previously set
@@ -666,6 +681,15 @@ def as_signal(
 
     as_signal.__doc__ %= SHOW_PROGRESSBAR_ARG
 
+    def _get_components_nd(self, component_list=None):
+        """Return the components and their active arrays needed to evaluate
+        the model for the whole navigation space using ``function_nd``, or
+        None if the model can't be evaluated this way.
+
+        Only implemented in :class:`~hyperspy.models.model1d.Model1D`.
+        """
+        return None
+
     def _as_signal_iter(self, data, component_list=None, show_progressbar=None):
         # BUG: with lazy signal returns lazy signal with numpy array
         # Note that show_progressbar can be an int to determine the progressbar
@@ -1891,6 +1915,8 @@ def multifit(
         show_progressbar=None,
         interactive_plot=False,
         iterpath=None,
+        parallel=False,
+        num_workers=None,
         **kwargs,
     ):
         """Fit the data to the model at all positions of the navigation dimensions.
@@ -1924,6 +1950,16 @@ def multifit(
                 Works for n-dimensional navigation space, not just 2D.
             If None:
                 Use the value of :attr:`~.axes.AxesManager.iterpath`.
+        parallel : bool, default False
+            If True, the navigation space is split in blocks along its slowest
+            axis (the first axis of the data array) and each block is fitted
+            in a separate process with a copy of the model. The resulting
+            parameter maps, ``chisq`` and ``dof`` are written back into
+            this model. Not compatible with ``autosave`` and
+            ``interactive_plot``. See Notes for the seeding strategy.
+        num_workers : None or int, default None
+            Number of worker processes used when ``parallel=True``. If None,
+            the number of CPUs is used.
         **kwargs : dict
             Any extra keyword argument will be passed to the fit method.
             See the documentation for :meth:`~hyperspy.model.BaseModel.fit`
@@ -1937,10 +1973,36 @@ def multifit(
         --------
         fit
 
+        Notes
+        -----
+        When ``parallel=True``, every block starts from the current values of
+        the model parameters and is then iterated independently following
+        ``iterpath``, exactly as in the serial case: at each position the
+        stored values are used when they are set (see
+        :meth:`~hyperspy.model.BaseModel.fetch_stored_values`), otherwise the
+        result of the previous position of the same block. Therefore, the
+        result is independent of the number of workers but, as the first
+        position of each block is not seeded from its neighbour in the
+        previous block, it can differ from the serial fit when the stored
+        values are not set. The model is transferred to the workers using its
+        dictionary representation and the fitting keyword arguments using
+        ``cloudpickle``, so they must be serializable.
+
         """
         if show_progressbar is None:
             show_progressbar = preferences.General.show_progressbar
 
+        if parallel and (autosave or interactive_plot):
+            raise ValueError(
+                "`parallel=True` is not compatible with `autosave` and "
+                "`interactive_plot`."
+            )
+        if parallel and not (iterpath is None or isinstance(iterpath, str)):
+            raise ValueError(
+                "`parallel=True` only supports the `'flyback'` and "
+                "`'serpentine'` iterpaths."
+            )
+
         if autosave:
             fd, autosave_fn = tempfile.mkstemp(
                 prefix="hyperspy_autosave-", dir=".", suffix=".npz"
@@ -2082,6 +2144,19 @@ def multifit(
                 # implementation, a more elegant implementation could be found
                 self._binned = None
                 return
+
+        if parallel and self.axes_manager.navigation_dimension > 0:
+            self._multifit_parallel(
+                mask=mask,
+                fetch_only_fixed=fetch_only_fixed,
+                show_progressbar=show_progressbar,
+                iterpath=iterpath,
+                num_workers=num_workers,
+                **kwargs,
+            )
+            self._binned = None
+            return
+
         # Fitting in a vectorized fashion is not supported. We iterate over the
         # navigation indices and fit the dataset one by one.
         i = 0
@@ -2130,6 +2205,69 @@ def multifit(
 
     multifit.__doc__ %= SHOW_PROGRESSBAR_ARG
 
+    def _multifit_parallel(
+        self, mask, show_progressbar, num_workers=None, **multifit_kwargs
+    ):
+        """Fit blocks of the navigation space in separate processes.
+
+        The blocks are taken along the first axis of the navigation array,
+        each block being a model obtained with ``inav`` and transferred to
+        the worker processes as dictionaries.
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        from hyperspy.samfire_utils.samfire_pool import _walk_compute
+
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        nav_dim = self.axes_manager.navigation_dimension
+        nav_shape = self.axes_manager._navigation_shape_in_array
+        n_blocks = max(min(nav_shape[0], num_workers), 1)
+        edges = np.linspace(0, nav_shape[0], n_blocks + 1).astype(int)
+        blocks = [
+            slice(start, stop) for start, stop in zip(edges[:-1], edges[1:])
+        ]
+        total = int(np.prod(nav_shape)) - (0 if mask is None else int(mask.sum()))
+
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = {}
+            for block in blocks:
+                # `inav` uses the axes_manager order, i.e. the slowest axis
+                # is the last one
+                model = self.inav[(slice(None),) * (nav_dim - 1) + (block,)]
+                signal_dict = _walk_compute(
+                    model.signal._to_dictionary(
+                        add_learning_results=False, add_original_metadata=False
+                    )
+                )
+                model_dict = _walk_compute(model.as_dictionary())
+                block_mask = None if mask is None else mask[block]
+                payload = cloudpickle.dumps(
+                    (signal_dict, model_dict, block_mask, multifit_kwargs)
+                )
+                future = executor.submit(_multifit_block, payload)
+                block_size = model.axes_manager.navigation_size
+                if block_mask is not None:
+                    block_size -= int(block_mask.sum())
+                futures[future] = (block, block_size)
+
+            with progressbar(
+                total=total, disable=not show_progressbar, leave=True
+            ) as pbar:
+                for future in as_completed(futures):
+                    block, block_size = futures[future]
+                    maps, chisq, dof = future.result()
+                    for component, component_maps in zip(self, maps):
+                        for parameter, map_ in zip(
+                            component.parameters, component_maps
+                        ):
+                            parameter.map[block] = map_
+                    self.chisq.data[block] = chisq
+                    self.dof.data[block] = dof
+                    pbar.update(block_size)
+
+        self.fetch_stored_values()
+
     def save_parameters2file(self, filename):
         """Save the parameters array in binary format.
 
@@ -2645,6 +2783,24 @@ def create_samfire(self, workers=None, setup=True, **kwargs):
         return Samfire(self, workers=workers, setup=setup, **kwargs)
 
 
+def _multifit_block(payload):
+    """Recreate a model from its dictionary and fit all its positions.
+
+    Used by :meth:`BaseModel.multifit` with ``parallel=True``, it runs
+    in a worker process and returns the parameter maps, ``chisq`` and
+    ``dof`` of the fitted block.
+    """
+    signal_dict, model_dict, mask, multifit_kwargs = cloudpickle.loads(payload)
+    signal = BaseSignal(**signal_dict)
+    signal._assign_subclass()
+    model = signal.create_model(dictionary=model_dict)
+    model.multifit(mask=mask, show_progressbar=False, **multifit_kwargs)
+    maps = [
+        [parameter.map for parameter in component.parameters] for component in model
+    ]
+    return maps, model.chisq.data, model.dof.data
+
+
 class ModelSpecialSlicers(object):
     def __init__(self, model, isNavigation):
         self.isNavigation = isNavigation
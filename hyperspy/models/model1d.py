@@ -27,6 +27,8 @@
 from hyperspy.drawing.widgets import LabelWidget, VerticalLineWidget
 from hyperspy.events import EventSuppressor
 from hyperspy.exceptions import SignalDimensionError
+from hyperspy.external.progressbar import progressbar
+from hyperspy.misc.model_tools import _is_parameter_map_set, _parameter_maps_block
 from hyperspy.misc.utils import dummy_context_manager
 from hyperspy.model import BaseModel, ModelComponents
 from hyperspy.signal_tools import SpanSelectorInSignal1D
@@ -226,6 +228,9 @@ class Model1D(BaseModel):
     """
 
     _signal_dimension = 1
+    # Maximum size (in bytes) of the model data evaluated at once when
+    # evaluating the model for the whole navigation space
+    _nd_block_nbytes = 2**26
 
     def __init__(self, signal1D, dictionary=None):
         super().__init__()
@@ -390,6 +395,98 @@ def _get_current_data(
                 model_data *= np.gradient(self.axis.axis)
         return model_data
 
+    def _get_components_nd(self, component_list=None):
+        if self.axes_manager.navigation_dimension == 0:
+            return None
+        if self.axis.index_in_array != len(self.signal.data.shape) - 1:
+            return None
+        if component_list:
+            # As in `_as_signal_iter`, the components of the list are active,
+            # unless their active state is multidimensional
+            components = [self._get_component(x) for x in component_list]
+        else:
+            components = [
+                component
+                for component in self
+                if component.active_is_multidimensional or component.active
+            ]
+        for component in components:
+            if not hasattr(component, "function_nd"):
+                return None
+            for parameter in component.parameters:
+                if not _is_parameter_map_set(parameter):
+                    return None
+        return [
+            (
+                component,
+                component._active_array
+                if component.active_is_multidimensional
+                else None,
+            )
+            for component in components
+        ]
+
+    def _get_model_data_nd(self, components_nd, block=()):
+        """
+        Return the model data for a block of the navigation space, evaluated
+        using the ``function_nd`` method of the components.
+
+        Parameters
+        ----------
+        components_nd : list of tuple
+            The components and their active array (or None), as returned by
+            ``_get_components_nd``.
+        block : tuple of slice
+            The block of the navigation space, in array order. The default is
+            the whole navigation space.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``block_shape + (n_channels,)``, where the number of
+            channels is given by ``_channel_switches``.
+        """
+        axis = self.axis.axis[self._channel_switches]
+        nav_shape = self.axes_manager._navigation_shape_in_array
+        block_shape = tuple(
+            len(range(*slice_.indices(size))) for slice_, size in zip(block, nav_shape)
+        ) + tuple(nav_shape[len(block) :])
+        model_data = np.zeros(block_shape + axis.shape)
+        with _parameter_maps_block([c for c, _ in components_nd], block):
+            for component, active_array in components_nd:
+                component_data = component.function_nd(axis)
+                if active_array is not None:
+                    component_data = np.where(
+                        active_array[block][..., np.newaxis], component_data, 0
+                    )
+                model_data += component_data
+        if self.axis.is_binned:
+            if self.axis.is_uniform:
+                model_data *= self.axis.scale
+            else:
+                model_data *= np.gradient(self.axis.axis)[self._channel_switches]
+        return model_data
+
+    def _as_signal_nd(self, data, components_nd, show_progressbar=None):
+        nav_shape = self.axes_manager._navigation_shape_in_array
+        # Evaluate the model by blocks of the first navigation axis to
+        # limit the memory used by the intermediate arrays
+        nbytes_per_row = (
+            np.prod(nav_shape[1:], dtype=int)
+            * np.count_nonzero(self._channel_switches)
+            * np.dtype(float).itemsize
+        )
+        rows = max(int(self._nd_block_nbytes // max(nbytes_per_row, 1)), 1)
+        with progressbar(
+            total=nav_shape[0], disable=not show_progressbar, leave=True
+        ) as pbar:
+            for start in range(0, nav_shape[0], rows):
+                block = (slice(start, min(start + rows, nav_shape[0])),)
+                data[block][..., self._channel_switches] = self._get_model_data_nd(
+                    components_nd, block
+                )
+                pbar.update(block[0].stop - start)
+
     def _errfunc(self, param, y, weights=None):
         if weights is None:
             weights = 1.0
@@ -85,13 +85,18 @@
 from hyperspy.misc.slicing import FancySlicing, SpecialSlicers
 from hyperspy.misc.utils import (
     DictionaryTreeBrowser,
+    _compute_first_block,
     _get_block_pattern,
+    _get_map_probe_cache,
+    _get_map_probe_cache_key,
+    _set_map_probe_cache,
     add_scalar_axis,
     guess_output_signal_size,
     is_cupy_array,
     isiterable,
     iterable_not_string,
     process_function_blockwise,
+    process_function_shared_memory,
     rollelem,
     slugify,
     to_numpy,
@@ -5151,6 +5156,8 @@ def map(
         output_signal_size=None,
         output_dtype=None,
         lazy_output=None,
+        vectorized=None,
+        scheduler=None,
         **kwargs,
     ):
         """Apply a function to the signal data at all the navigation
@@ -5207,6 +5214,26 @@ def map(
             See docstring for output_signal_size for more information.
             Default None.
         %s
+        vectorized : None or bool, default None
+            If ``True``, the function is called once per chunk instead of
+            once per navigation pixel. The navigation dimensions of the chunk
+            are flattened into a leading batch axis, i.e. the function
+            receives an array of shape ``(n_pixels,) + signal_shape`` and the
+            iterating keyword arguments are sliced accordingly. The function
+            must return an array of shape ``(n_pixels,) + output_signal_shape``.
+            If ``None``, the function is vectorized only when it has been
+            decorated with :func:`~hyperspy.decorators.batched`, otherwise
+            it is applied pixel-by-pixel.
+        scheduler : None, ``"threads"`` or ``"processes"``, default None
+            If ``None`` or ``"threads"``, the function is applied using the
+            dask threaded scheduler. If ``"processes"``, a pool of
+            ``num_workers`` processes is used instead, which is useful for
+            functions holding the GIL. In this case, the data is placed in
+            shared memory and the workers write the results into a shared
+            output array, so that the data is never copied to each process.
+            The function must be serialisable with ``cloudpickle``. Only
+            supported for non-lazy signals with non-lazy and non-ragged
+            output.
         **kwargs : dict
             All extra keyword arguments are passed to the provided function
 
@@ -5276,11 +5303,20 @@ def map(
         ... )
         >>> s.compute()
 
+        Functions which can operate on many signals at once can be applied
+        chunk-by-chunk, avoiding the overhead of calling the function for
+        each navigation pixel:
+
+        >>> s = hs.signals.Signal1D(np.random.random((64, 64, 100)))
+        >>> s_sum = s.map(lambda x: x.sum(axis=-1), vectorized=True, inplace=False)
+
         """
         if lazy_output is None:
             lazy_output = self._lazy
         if ragged is None:
             ragged = self.ragged
+        if vectorized is None:
+            vectorized = getattr(function, "_hyperspy_batched", False) is True
 
         # Separate arguments to pass to the mapping function:
         # ndkwargs dictionary contains iterating arguments which must be signals.
@@ -5380,6 +5416,8 @@ def map(
                 output_dtype=output_dtype,
                 output_signal_size=output_signal_size,
                 navigation_chunks=navigation_chunks,
+                vectorized=vectorized,
+                scheduler=scheduler,
                 **kwargs,  # function argument(s) (non-iterating)
             )
         if not inplace:
@@ -5424,10 +5462,21 @@ def _map_iterate(
         lazy_output=None,
         num_workers=None,
         navigation_chunks="auto",
+        vectorized=False,
+        scheduler=None,
         **kwargs,
     ):
         if lazy_output is None:
             lazy_output = self._lazy
+        if scheduler not in (None, "threads", "processes"):
+            raise ValueError(
+                f"`scheduler` must be None, 'threads' or 'processes', not {scheduler}."
+            )
+        if scheduler == "processes" and (self._lazy or lazy_output or ragged):
+            raise ValueError(
+                "The 'processes' scheduler is only supported for non-lazy "
+                "signals, non-lazy output and non-ragged output."
+            )
 
         if not self._lazy:
             s_input = self.as_lazy()
@@ -5469,60 +5518,113 @@ def _map_iterate(
 
         args, arg_keys = old_sig._get_iterating_kwargs(iterating_kwargs)
 
+        data = old_sig.data
         if autodetermine:  # trying to guess the output d-type and size from one signal
-            testing_kwargs = {}
-            for ikey, key in enumerate(arg_keys):
-                test_ind = (0,) * len(os_am.navigation_axes)
-                # For discussion on if squeeze is necessary, see
-                # https://github.com/hyperspy/hyperspy/pull/2981
-                testing_kwargs[key] = np.squeeze(args[ikey][test_ind].compute())[()]
-            testing_kwargs = {**kwargs, **testing_kwargs}
-            test_data = np.array(
-                old_sig.inav[(0,) * len(os_am.navigation_shape)].data.compute()
-            )
-            temp_output_signal_size, temp_output_dtype = guess_output_signal_size(
-                test_data=test_data,
-                function=function,
-                ragged=ragged,
-                **testing_kwargs,
+            nav_dim = len(os_am.navigation_axes)
+            # The output signal size and dtype of previous calls are cached
+            # to avoid running the function outside of the dask graph again
+            cache_key = _get_map_probe_cache_key(
+                function, data, args, arg_keys, nav_dim, ragged, vectorized, **kwargs
             )
+            probe = _get_map_probe_cache(cache_key)
+            if probe is None and ragged:
+                # no need to read any data
+                probe = guess_output_signal_size(None, function, ragged=True)
+            elif probe is None:
+                test_ind = (0,) * nav_dim
+                if self._lazy:
+                    # Reading one pixel can require to read (and decompress)
+                    # the whole chunk: we read the first chunk and reuse it
+                    # in the computation instead of reading it twice
+                    first_block, data = _compute_first_block(data)
+                    test_data = np.array(first_block[test_ind])
+                    test_args, reused_args = (), ()
+                    for arg in args:
+                        first_block, arg = _compute_first_block(arg)
+                        test_args += (first_block[test_ind],)
+                        reused_args += (arg,)
+                    args = reused_args
+                else:
+                    test_data = np.array(data[test_ind].compute())
+                    test_args = tuple(arg[test_ind].compute() for arg in args)
+                testing_kwargs = {}
+                for key, test_arg in zip(arg_keys, test_args):
+                    # For discussion on if squeeze is necessary, see
+                    # https://github.com/hyperspy/hyperspy/pull/2981
+                    testing_kwargs[key] = np.squeeze(test_arg)[()]
+                    if vectorized:
+                        testing_kwargs[key] = np.asarray(testing_kwargs[key])[np.newaxis]
+                testing_kwargs = {**kwargs, **testing_kwargs}
+                probe = guess_output_signal_size(
+                    test_data=test_data,
+                    function=function,
+                    ragged=ragged,
+                    vectorized=vectorized,
+                    **testing_kwargs,
+                )
+                _set_map_probe_cache(cache_key, probe)
+            temp_output_signal_size, temp_output_dtype = probe
             if output_signal_size is None:
                 output_signal_size = temp_output_signal_size
             if output_dtype is None:
                 output_dtype = temp_output_dtype
         output_shape = self.axes_manager._navigation_shape_in_array + output_signal_size
         arg_pairs, adjust_chunks, new_axis, output_pattern = _get_block_pattern(
-            (old_sig.data,) + args, output_shape
+            (data,) + args, output_shape
         )
 
         axes_changed = len(new_axis) != 0 or len(adjust_chunks) != 0
 
-        if show_progressbar:
+        # dask progress bar, the process scheduler has its own
+        dask_progressbar = show_progressbar and scheduler != "processes"
+        if dask_progressbar:
             pbar = ProgressBar()
             pbar.register()
 
-        mapped = da.blockwise(
-            process_function_blockwise,
-            output_pattern,
-            *concat(arg_pairs),
-            adjust_chunks=adjust_chunks,
-            new_axes=new_axis,
-            align_arrays=False,
-            dtype=output_dtype,
-            concatenate=True,
-            arg_keys=arg_keys,
-            function=function,
-            output_dtype=output_dtype,
-            nav_indexes=nav_indexes,
-            output_signal_size=output_signal_size,
-            **kwargs,
-        )
-
-        data_stored = False
+        if scheduler == "processes":
+            mapped = process_function_shared_memory(
+                self.data,
+                *[np.asarray(arg.compute()) for arg in args],
+                function=function,
+                output_signal_size=output_signal_size,
+                output_dtype=output_dtype,
+                nav_dim=len(nav_indexes),
+                arg_keys=arg_keys,
+                num_workers=num_workers,
+                vectorized=vectorized,
+                show_progressbar=show_progressbar,
+                **kwargs,
+            )
+            # the result is already a numpy array
+            data_stored = True
+        else:
+            mapped = da.blockwise(
+                process_function_blockwise,
+                output_pattern,
+                *concat(arg_pairs),
+                adjust_chunks=adjust_chunks,
+                new_axes=new_axis,
+                align_arrays=False,
+                dtype=output_dtype,
+                # providing meta avoids dask calling the function to infer it
+                meta=np.empty(
+                    (0,) * len(output_shape), dtype=output_dtype, like=data._meta
+                ),
+                concatenate=True,
+                arg_keys=arg_keys,
+                function=function,
+                output_dtype=output_dtype,
+                nav_indexes=nav_indexes,
+                output_signal_size=output_signal_size,
+                vectorized=vectorized,
+                **kwargs,
+            )
+            data_stored = False
 
         if inplace:
             if (
-                not self._lazy
+                not data_stored
+                and not self._lazy
                 and not lazy_output
                 and (mapped.shape == self.data.shape)
                 and (mapped.dtype == self.data.dtype)
@@ -5566,7 +5668,7 @@ def _map_iterate(
         if not lazy_output and not data_stored:
             sig.data = sig.data.compute(num_workers=num_workers)
 
-        if show_progressbar:
+        if dask_progressbar:
             pbar.unregister()
 
         return sig
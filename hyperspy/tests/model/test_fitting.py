@@ -586,6 +586,64 @@ def test_autosave(self):
         m.multifit(autosave=True, autosave_every=1)
 
 
+@lazifyTestClass
+class TestMultifitParallel:
+    def setup_method(self, method):
+        rng = np.random.default_rng(1)
+        s = hs.signals.Signal1D(np.zeros((3, 4, 100)))
+        m = s.create_model()
+        g = hs.model.components1D.Gaussian()
+        m.append(g)
+        g.A.map["values"] = rng.uniform(50, 100, size=(3, 4))
+        g.centre.map["values"] = rng.uniform(40, 60, size=(3, 4))
+        g.sigma.map["values"] = rng.uniform(4, 8, size=(3, 4))
+        for p in g.parameters:
+            p.map["is_set"] = True
+        s.data = m.as_signal().data + rng.normal(0, 0.5, size=s.data.shape)
+        for p in g.parameters:
+            p.map["is_set"] = False
+        g.A.value = 75
+        g.centre.value = 50
+        g.sigma.value = 6
+        self.m = m
+
+    @pytest.mark.parametrize("num_workers", [1, 2, 5])
+    def test_same_as_serial(self, num_workers):
+        m = self.m
+        m2 = m.inav[:, :]
+        m2.multifit()
+        m.multifit(parallel=True, num_workers=num_workers)
+        for p, p2 in zip(m[0].parameters, m2[0].parameters):
+            np.testing.assert_allclose(p.map["values"], p2.map["values"], rtol=1e-5)
+            assert np.all(p.map["is_set"])
+        np.testing.assert_allclose(m.chisq.data, m2.chisq.data, rtol=1e-5)
+        np.testing.assert_array_equal(m.dof.data, m2.dof.data)
+        assert m[0].A.value == m[0].A.map["values"][0, 0]
+
+    def test_mask_and_kwargs(self):
+        m = self.m
+        mask = np.zeros((3, 4), dtype=bool)
+        mask[1, 2] = True
+        m.multifit(
+            parallel=True, num_workers=2, mask=mask, optimizer="trf", bounded=True
+        )
+        assert not m[0].A.map["is_set"][1, 2]
+        assert m[0].A.map["is_set"].sum() == 11
+        assert np.isnan(m.chisq.data[1, 2])
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"autosave": True},
+            {"interactive_plot": True},
+            {"iterpath": np.array([(0, 0), (1, 1)])},
+        ],
+    )
+    def test_not_supported(self, kwargs):
+        with pytest.raises(ValueError, match="parallel"):
+            self.m.multifit(parallel=True, **kwargs)
+
+
 def _generate():
     for i in range(3):
         yield (i, i)
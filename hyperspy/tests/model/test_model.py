@@ -683,6 +683,66 @@ def test_out_argument(self):
         assert np.all(s.data == 4.0)
 
 
+class TestAsSignalVectorized:
+    def setup_method(self, method):
+        rng = np.random.default_rng(0)
+        s = hs.signals.Signal1D(rng.random((3, 4, 50)))
+        s.axes_manager[-1].is_binned = True
+        s.axes_manager[-1].scale = 0.5
+        m = s.create_model()
+        g1 = hs.model.components1D.Expression(
+            "A * exp(-(x - c)**2 / (2 * sigma**2))", name="g1", A=1, c=10, sigma=2
+        )
+        g2 = hs.model.components1D.Expression(
+            "A * exp(-(x - c)**2 / (2 * sigma**2))", name="g2", A=2, c=10, sigma=3
+        )
+        offset = hs.model.components1D.Offset()
+        m.extend([g1, g2, offset])
+        g2.c.twin = g1.c
+        g2.c.twin_function_expr = "x + 5"
+        m.assign_current_values_to_all()
+        g1.A.map["values"] = rng.random((3, 4))
+        g1.c.map["values"] = rng.random((3, 4)) * 10
+        offset.offset.map["values"] = rng.random((3, 4))
+        offset.active_is_multidimensional = True
+        offset._active_array[0, 1] = False
+        self.m = m
+
+    def _as_signal_iter(self, **kwargs):
+        with mock.patch.object(self.m, "_get_components_nd", return_value=None):
+            return self.m.as_signal(**kwargs)
+
+    @pytest.mark.parametrize("component_list", (None, ["g2"], ["Offset"]))
+    def test_same_as_iter(self, component_list):
+        self.m.set_signal_range(5, 20)
+        assert self.m._get_components_nd(component_list) is not None
+        s = self.m.as_signal(component_list=component_list)
+        s_iter = self._as_signal_iter(component_list=component_list)
+        np.testing.assert_allclose(s.data, s_iter.data)
+
+    def test_out_of_range_to_nan(self):
+        self.m.set_signal_range(5, 20)
+        s = self.m.as_signal(out_of_range_to_nan=False)
+        s_iter = self._as_signal_iter(out_of_range_to_nan=False)
+        assert not np.isnan(s.data).any()
+        np.testing.assert_allclose(s.data, s_iter.data)
+
+    def test_blocks(self):
+        self.m._nd_block_nbytes = 1
+        s = self.m.as_signal()
+        s_iter = self._as_signal_iter()
+        np.testing.assert_allclose(s.data, s_iter.data)
+
+    def test_parameter_not_set(self):
+        self.m[0].A.map["is_set"][0, 0] = False
+        assert self.m._get_components_nd() is None
+
+    def test_no_function_nd(self):
+        self.m.append(hs.model.components1D.Gaussian())
+        assert self.m._get_components_nd() is None
+        assert self.m._get_components_nd(["g1"]) is not None
+
+
 @lazifyTestClass
 class TestCreateModel:
     def setup_method(self, method):
@@ -23,6 +23,7 @@
 
 import hyperspy.api as hs
 from hyperspy import _lazy_signals
+from hyperspy.defaults_parser import preferences
 from hyperspy._signals.lazy import (
     _get_navigation_dimension_chunk_slice,
     _reshuffle_mixed_blocks,
@@ -247,9 +248,71 @@ def test_change_position(self):
         assert np.all(s._cache_dask_chunk == 2)
 
         s._get_cache_dask_chunk((6, 4, slice(None), slice(None)))
+        # the previous chunk is kept in the cache
+        s._get_cache_dask_chunk((0, 0, slice(None), slice(None)))
+        assert np.all(s._cache_dask_chunk == 2)
+
+        s._clear_cache_dask_data()
         s._get_cache_dask_chunk((0, 0, slice(None), slice(None)))
         assert np.all(s._cache_dask_chunk == 0)
 
+    def test_cache_size(self):
+        s = _lazy_signals.LazySignal1D(da.zeros((10, 10, 1000), chunks=(5, 5, 1000)))
+        chunk_nbytes = 5 * 5 * 1000 * 8
+        cache_size = preferences.General.lazy_chunk_cache_size
+        prefetch = preferences.General.lazy_chunk_prefetch
+        try:
+            preferences.General.lazy_chunk_prefetch = False
+            preferences.General.lazy_chunk_cache_size = 2.5 * chunk_nbytes / 2**20
+            for indices in [(0, 0), (6, 0), (0, 6), (6, 6)]:
+                s._get_cache_dask_chunk(indices + (slice(None),))
+            # Only the two last chunks fit in the cache
+            assert list(s._cache_dask_chunks.keys()) == [
+                ((0, 5), (5, 10)),
+                ((5, 10), (5, 10)),
+            ]
+            s._get_cache_dask_chunk((6, 0, slice(None)))
+            assert list(s._cache_dask_chunks.keys()) == [
+                ((5, 10), (5, 10)),
+                ((5, 10), (0, 5)),
+            ]
+        finally:
+            preferences.General.lazy_chunk_cache_size = cache_size
+            preferences.General.lazy_chunk_prefetch = prefetch
+
+    def test_prefetch(self):
+        s = _lazy_signals.LazySignal1D(
+            da.arange(15 * 10 * 20, chunks=(5 * 10 * 20)).reshape((15, 10, 20))
+        )
+        s.rechunk(nav_chunks=(5, 5))
+        prefetch = preferences.General.lazy_chunk_prefetch
+        try:
+            preferences.General.lazy_chunk_prefetch = True
+            s._get_cache_dask_chunk((0, 3, slice(None)))
+            assert not s._cache_dask_chunks_prefetch
+            # moving along the last navigation axis (x)
+            s._get_cache_dask_chunk((0, 4, slice(None)))
+            assert list(s._cache_dask_chunks_prefetch.keys()) == [((0, 5), (5, 10))]
+            for future in s._cache_dask_chunks_prefetch.values():
+                future.result()
+            value = s._get_cache_dask_chunk((1, 5, slice(None)))
+            np.testing.assert_allclose(value, s.data[1, 5].compute())
+            assert ((0, 5), (5, 10)) in s._cache_dask_chunks
+            # moving along both axes, only the neighbour along the first axis
+            # is in the data
+            assert list(s._cache_dask_chunks_prefetch.keys()) == [((5, 10), (5, 10))]
+        finally:
+            preferences.General.lazy_chunk_prefetch = prefetch
+
+    def test_data_changed_clear_cache(self):
+        s = _lazy_signals.LazySignal1D(da.zeros((10, 10, 20), chunks=(5, 5, 20)))
+        s._get_cache_dask_chunk((0, 0, slice(None)))
+        s._get_cache_dask_chunk((6, 0, slice(None)))
+        assert len(s._cache_dask_chunks) == 2
+        s.events.data_changed.trigger(obj=s)
+        assert len(s._cache_dask_chunks) == 0
+        assert s._cache_dask_chunk is None
+
     @pytest.mark.parametrize(
         "shape",
         [
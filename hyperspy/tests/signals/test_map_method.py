@@ -1282,3 +1282,157 @@ def test_map(self, inplace):
         assert sig.axes_manager.signal_shape == (64, 64)
         assert sig.axes_manager.navigation_shape == (10,)
         assert sig.data.shape == (10, 64, 64)
+
+
+class TestMapVectorized:
+    def setup_method(self, method):
+        self.s = hs.signals.Signal1D(np.arange(6 * 7 * 10.0).reshape((6, 7, 10)))
+
+    @pytest.mark.parametrize("lazy", (True, False))
+    def test_called_per_chunk(self, lazy):
+        s = self.s.as_lazy() if lazy else self.s
+        shapes = []
+
+        def function(spectra):
+            shapes.append(spectra.shape)
+            return spectra * 2
+
+        s_out = s.map(function, vectorized=True, inplace=False)
+        if lazy:
+            s_out.compute()
+        np.testing.assert_allclose(s_out.data, self.s.data * 2)
+        # probe + calls per chunk, each with a flat batch axis
+        assert shapes[0] == (1, 10)
+        batches = [shape for shape in shapes[1:] if shape[0] > 0]
+        assert all(len(shape) == 2 for shape in batches)
+        assert sum(shape[0] for shape in batches) == 42
+
+    def test_reduce_with_iterating_kwarg(self):
+        factor = hs.signals.BaseSignal(np.arange(42.0).reshape((6, 7))).T
+
+        def function(spectra, factor):
+            assert factor.shape == (spectra.shape[0],)
+            return spectra.sum(axis=-1) * factor
+
+        s_out = self.s.map(function, factor=factor, vectorized=True, inplace=False)
+        assert s_out.axes_manager.signal_shape == ()
+        np.testing.assert_allclose(
+            s_out.data, self.s.data.sum(axis=-1) * factor.data
+        )
+
+    def test_batched_decorator(self):
+        from hyperspy.decorators import batched
+
+        @batched
+        def function(spectra):
+            assert spectra.ndim == 2
+            return spectra[:, :5]
+
+        self.s.map(function)
+        assert self.s.axes_manager.signal_shape == (5,)
+        np.testing.assert_allclose(
+            self.s.data, np.arange(6 * 7 * 10.0).reshape((6, 7, 10))[..., :5]
+        )
+
+    def test_not_vectorized_by_default(self):
+        def function(spectrum):
+            assert spectrum.ndim == 1
+            return spectrum
+
+        self.s.map(function)
+
+
+class TestMapProbe:
+    def setup_method(self, method):
+        from hyperspy.misc import utils
+
+        utils._MAP_PROBE_CACHE.clear()
+        self.reads = []
+
+        def read(block):
+            self.reads.append(block.shape)
+            return block
+
+        data = da.from_array(np.arange(4 * 5 * 6.0).reshape((4, 5, 6)), chunks=(2, 5, 6))
+        self.s = hs.signals.Signal1D(data).as_lazy()
+        self.s.data = data.map_blocks(read, meta=np.array((), dtype=data.dtype))
+
+    def test_first_chunk_read_once(self):
+        s_out = self.s.map(lambda x: x[:3], inplace=False)
+        s_out.compute()
+        np.testing.assert_allclose(
+            s_out.data, np.arange(4 * 5 * 6.0).reshape((4, 5, 6))[..., :3]
+        )
+        assert self.reads == [(2, 5, 6), (2, 5, 6)]
+
+    def test_first_chunk_read_once_iterating_kwarg(self):
+        factor = hs.signals.BaseSignal(np.arange(20.0).reshape((4, 5))).T
+        s_out = self.s.map(power_function, e=factor, inplace=False)
+        s_out.compute()
+        np.testing.assert_allclose(
+            s_out.data,
+            np.arange(4 * 5 * 6.0).reshape((4, 5, 6)) ** factor.data[..., np.newaxis],
+        )
+        assert self.reads == [(2, 5, 6), (2, 5, 6)]
+
+    def test_cached_probe(self):
+        m = mock.Mock(side_effect=lambda x, n: x[:n])
+        self.s.map(m, n=3, inplace=False)
+        assert m.call_count == 1
+        m.reset_mock()
+        s_out = self.s.map(m, n=3, inplace=False)
+        assert m.call_count == 0
+        assert s_out.axes_manager.signal_shape == (3,)
+        # a different argument isn't cached
+        s_out = self.s.map(m, n=2, inplace=False)
+        assert m.call_count == 1
+        assert s_out.axes_manager.signal_shape == (2,)
+
+    def test_not_cached_unhashable_kwarg(self):
+        m = mock.Mock(side_effect=lambda x, n: x[: n["n"]])
+        self.s.map(m, n={"n": 3}, inplace=False)
+        self.s.map(m, n={"n": 3}, inplace=False)
+        assert m.call_count == 2
+
+
+class TestMapProcesses:
+    def setup_method(self, method):
+        self.s = hs.signals.Signal2D(np.random.random((4, 5, 8, 8)))
+
+    def test_iterating_kwarg(self):
+        sigma = hs.signals.BaseSignal(np.linspace(1, 2, 20).reshape((4, 5))).T
+        s_out = self.s.map(
+            gaussian_filter,
+            sigma=sigma,
+            inplace=False,
+            scheduler="processes",
+            num_workers=2,
+        )
+        s_ref = self.s.map(gaussian_filter, sigma=sigma, inplace=False)
+        np.testing.assert_allclose(s_out.data, s_ref.data)
+        assert not s_out._lazy
+
+    def test_reduce_inplace(self):
+        data = self.s.data.copy()
+        self.s.map(np.sum, scheduler="processes", num_workers=2)
+        assert self.s.axes_manager.signal_shape == ()
+        np.testing.assert_allclose(self.s.data, data.sum(axis=(-2, -1)))
+
+    def test_vectorized(self):
+        s_out = self.s.map(
+            lambda x: x[..., :3] * 2,
+            vectorized=True,
+            inplace=False,
+            scheduler="processes",
+            num_workers=3,
+        )
+        assert s_out.axes_manager.signal_shape == (3, 8)
+        np.testing.assert_allclose(s_out.data, self.s.data[..., :3] * 2)
+
+    def test_lazy_not_supported(self):
+        with pytest.raises(ValueError, match="only supported for non-lazy"):
+            self.s.map(identify_function, lazy_output=True, scheduler="processes")
+
+    def test_wrong_scheduler(self):
+        with pytest.raises(ValueError, match="`scheduler` must be"):
+            self.s.map(identify_function, scheduler="distributed")